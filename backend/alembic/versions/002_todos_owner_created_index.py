@@ -0,0 +1,25 @@
+"""Add composite index on todos (owner_id, created_at)
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_todos_owner_created', 'todos', ['owner_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_todos_owner_created', table_name='todos')
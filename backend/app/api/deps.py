@@ -0,0 +1,26 @@
+"""
+Shared dependency providers for API endpoints.
+
+FastAPI caches dependency results per request (use_cache=True is the
+default), so each service/repository is constructed at most once per
+request even when several sub-dependencies ask for it.
+"""
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import get_database_session
+from app.db.repositories.user import UserRepository
+from app.services.auth import AuthService
+from app.services.todo import TodoService
+
+
+async def get_auth_service(db: AsyncSession = Depends(get_database_session)) -> AuthService:
+    return AuthService(db)
+
+
+async def get_todo_service(db: AsyncSession = Depends(get_database_session)) -> TodoService:
+    return TodoService(db)
+
+
+async def get_user_repository(db: AsyncSession = Depends(get_database_session)) -> UserRepository:
+    return UserRepository(db)
@@ -1,19 +1,30 @@
 """
 Authentication API endpoints.
 """
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, EmailStr
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, ConfigDict, EmailStr
 
+from app.api.deps import get_auth_service, get_user_repository
 from app.core.security import verify_token
-from app.db.base import get_database_session
 from app.db.repositories.user import UserRepository
 from app.services.auth import AuthService
 
 router = APIRouter()
 security = HTTPBearer()
 
+# Short-lived cache of authenticated users so hot endpoints skip the
+# per-request SELECT. Stores detached UserResponse copies, never ORM
+# instances, to avoid sharing objects across sessions.
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=60)
+
+
+def _evict_user(user_id: int) -> None:
+    """Drop a user from the auth cache (logout, profile updates)."""
+    _user_cache.pop(user_id, None)
+
 
 class UserCreate(BaseModel):
     username: str
@@ -35,14 +46,13 @@ class UserResponse(BaseModel):
     username: str
     email: str
     is_active: bool
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_database_session)
+    user_repository: UserRepository = Depends(get_user_repository)
 ):
     """Dependency to get current authenticated user."""
     token_data = verify_token(credentials.credentials)
@@ -52,25 +62,29 @@ async def get_current_user(
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    user_repository = UserRepository(db)
+
+    cached = _user_cache.get(token_data.user_id)
+    if cached is not None:
+        return cached
+
     user = await user_repository.get(token_data.user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
-    
-    return user
+
+    user_response = UserResponse.model_validate(user)
+    _user_cache[token_data.user_id] = user_response
+    return user_response
 
 
 @router.post("/register", response_model=UserResponse)
 async def register(
     user_data: UserCreate,
-    db: AsyncSession = Depends(get_database_session)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Register a new user."""
-    auth_service = AuthService(db)
     user = await auth_service.create_user(
         username=user_data.username,
         email=user_data.email,
@@ -82,10 +96,9 @@ async def register(
 @router.post("/login")
 async def login(
     user_data: UserLogin,
-    db: AsyncSession = Depends(get_database_session)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Login and get access token."""
-    auth_service = AuthService(db)
     tokens = await auth_service.login(user_data.username, user_data.password)
     return tokens
 
@@ -93,10 +106,9 @@ async def login(
 @router.post("/refresh")
 async def refresh_token(
     token_request: RefreshTokenRequest,
-    db: AsyncSession = Depends(get_database_session)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Refresh access token using refresh token."""
-    auth_service = AuthService(db)
     tokens = await auth_service.refresh_token(token_request.refresh_token)
     return tokens
 
@@ -104,15 +116,18 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
     token_request: RefreshTokenRequest,
-    db: AsyncSession = Depends(get_database_session)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Logout and revoke refresh token."""
-    auth_service = AuthService(db)
+    token_data = verify_token(token_request.refresh_token, "refresh")
+    if token_data and token_data.user_id is not None:
+        _evict_user(token_data.user_id)
+
     success = await auth_service.logout(token_request.refresh_token)
     return {"success": success}
 
 
-@router.get("/me", response_model=UserResponse)
+@router.get("/me", response_model=UserResponse, response_class=ORJSONResponse)
 async def get_current_user_info(
     current_user = Depends(get_current_user)
 ):
@@ -2,21 +2,37 @@
 E2E Tests control endpoints.
 """
 import asyncio
+import functools
 import json
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
-from datetime import datetime
-from fastapi import Path
 
 from fastapi import APIRouter, HTTPException
 
 router = APIRouter()
 
-# In-memory job store (works for single-process dev usage)
-JOBS: Dict[str, Dict[str, Any]] = {}
+# In-memory job store (works for single-process dev usage), bounded so
+# stdout/stderr of old runs don't accumulate for the process lifetime
+MAX_JOBS = 100
+JOBS: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
 
+def _now_iso() -> str:
+    # Job timestamps only need second precision; strftime over gmtime is
+    # cheaper than building a datetime just to isoformat it
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+
+
+def _store_job(job_id: str, job: Dict[str, Any]) -> None:
+    JOBS[job_id] = job
+    while len(JOBS) > MAX_JOBS:
+        JOBS.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=1)
 def _repo_root() -> Path:
     # __file__ -> backend/app/api/v1/tests.py
     # parents[0]=v1, [1]=api, [2]=app, [3]=backend, [4]=repo root
@@ -25,6 +41,11 @@ def _repo_root() -> Path:
 
 import os
 
+# Invariant for the process lifetime; avoids a stat per request
+_IN_CONTAINER = Path("/.dockerenv").exists()
+
+
+@functools.lru_cache(maxsize=1)
 def _e2e_dir() -> Path:
     # Prefer explicit configuration
     env_path = os.getenv("E2E_TESTS_DIR")
@@ -48,13 +69,36 @@ def _e2e_dir() -> Path:
 
 import os as _os
 
-async def _run_command(cmd: str, cwd: Path, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-    proc = await asyncio.create_subprocess_shell(
-        cmd,
+async def _run_command(
+    args: List[str],
+    cwd: Path,
+    env: Optional[Dict[str, str]] = None,
+    stdout_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    # exec directly instead of spawning /bin/sh around every command
+    full_env = {**_os.environ, **(env or {})}
+    if stdout_path is not None and stderr_path is not None:
+        # Stream output straight to disk: a long Playwright run can emit
+        # hundreds of MB, which communicate() would buffer in memory
+        with stdout_path.open("wb") as out_f, stderr_path.open("wb") as err_f:
+            proc = await asyncio.create_subprocess_exec(
+                *args, cwd=str(cwd), stdout=out_f, stderr=err_f, env=full_env,
+            )
+            exit_code = await proc.wait()
+        return {
+            "exit_code": exit_code,
+            "stdout_path": str(stdout_path),
+            "stderr_path": str(stderr_path),
+        }
+
+    # Pipe path for short helper commands where output stays small
+    proc = await asyncio.create_subprocess_exec(
+        *args,
         cwd=str(cwd),
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
-        env={**_os.environ, **(env or {})},
+        env=full_env,
     )
     stdout_b, stderr_b = await proc.communicate()
     return {
@@ -64,6 +108,30 @@ async def _run_command(cmd: str, cwd: Path, env: Optional[Dict[str, str]] = None
     }
 
 
+def _tail(path_str: Optional[str], limit: int = 10000) -> str:
+    """Read the last `limit` bytes of a log file without loading all of it."""
+    if not path_str:
+        return ""
+    path = Path(path_str)
+    try:
+        with path.open("rb") as f:
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - limit))
+            return f.read().decode(errors="ignore")
+    except FileNotFoundError:
+        return ""
+
+
+async def _install_dependencies(e2e_dir: Path) -> None:
+    ci = await _run_command(["npm", "ci"], cwd=e2e_dir)
+    if ci["exit_code"] != 0:
+        await _run_command(["npm", "install"], cwd=e2e_dir)
+    browsers = await _run_command(["npx", "playwright", "install", "--with-deps"], cwd=e2e_dir)
+    if browsers["exit_code"] != 0:
+        await _run_command(["npx", "playwright", "install"], cwd=e2e_dir)
+
+
 def _read_results_json(results_path: Path) -> Optional[Dict[str, Any]]:
     try:
         with results_path.open("r", encoding="utf-8") as f:
@@ -75,7 +143,7 @@ def _read_results_json(results_path: Path) -> Optional[Dict[str, Any]]:
 async def _run_job(job_id: str):
     job = JOBS[job_id]
     job["status"] = "running"
-    job["started_at"] = datetime.utcnow().isoformat()
+    job["started_at"] = _now_iso()
     try:
         e2e_dir = _e2e_dir()
         results_dir = e2e_dir / "test-results"
@@ -89,36 +157,41 @@ async def _run_job(job_id: str):
 
         node_modules = e2e_dir / "node_modules"
         if not node_modules.exists():
-            await _run_command("npm ci || npm install", cwd=e2e_dir)
-            await _run_command("npx playwright install --with-deps || npx playwright install", cwd=e2e_dir)
+            await _install_dependencies(e2e_dir)
 
         env = {
             "CI": "1",
-            "API_BASE_URL": _os.getenv("API_BASE_URL", "http://backend:8000" if Path("/.dockerenv").exists() else "http://localhost:8000"),
+            "API_BASE_URL": _os.getenv("API_BASE_URL", "http://backend:8000" if _IN_CONTAINER else "http://localhost:8000"),
         }
-        run = await _run_command("npm test", cwd=e2e_dir, env=env)
+        run = await _run_command(
+            ["npm", "test"],
+            cwd=e2e_dir,
+            env=env,
+            stdout_path=results_dir / f"{job_id}.stdout.log",
+            stderr_path=results_dir / f"{job_id}.stderr.log",
+        )
 
         results_json = _read_results_json(results_json_path)
         job.update({
             "status": "succeeded" if run["exit_code"] == 0 else "failed",
             "exit_code": run["exit_code"],
-            "stdout": run["stdout"],
-            "stderr": run["stderr"],
+            "stdout_path": run["stdout_path"],
+            "stderr_path": run["stderr_path"],
             "results": results_json,
-            "finished_at": datetime.utcnow().isoformat(),
+            "finished_at": _now_iso(),
         })
     except Exception as e:
         job.update({
             "status": "failed",
             "error": str(e),
-            "finished_at": datetime.utcnow().isoformat(),
+            "finished_at": _now_iso(),
         })
 
 
 @router.post("/e2e-tests/start")
 async def start_e2e_tests():
     e2e_dir = _e2e_dir()
-    in_container = Path("/.dockerenv").exists()
+    in_container = _IN_CONTAINER
     if not e2e_dir.exists():
         detail = (
             "E2E tests directory not found. "
@@ -129,11 +202,11 @@ async def start_e2e_tests():
         raise HTTPException(status_code=501 if in_container else 500, detail=detail)
 
     job_id = uuid4().hex
-    JOBS[job_id] = {
+    _store_job(job_id, {
         "job_id": job_id,
         "status": "queued",
-        "created_at": datetime.utcnow().isoformat(),
-    }
+        "created_at": _now_iso(),
+    })
     try:
         # Start running job concurrently
         asyncio.create_task(_run_job(job_id))
@@ -145,13 +218,37 @@ async def start_e2e_tests():
 
 
 @router.get("/e2e-tests/status/{job_id}")
-async def get_e2e_status(job_id: str = Path(...)):
+async def get_e2e_status(job_id: str):
     job = JOBS.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    if job.get("stdout_path") or job.get("stderr_path"):
+        # The test-results page renders stdout/stderr straight from this
+        # poll once the job finishes; serve tails from the log files so
+        # the job store itself never holds the (potentially huge) output
+        return {
+            **job,
+            "stdout": _tail(job.get("stdout_path")),
+            "stderr": _tail(job.get("stderr_path")),
+        }
     return job
 
 
+@router.get("/e2e-tests/logs/{job_id}")
+async def get_e2e_logs(job_id: str):
+    """Return the tail of a job's captured stdout/stderr."""
+    job = JOBS.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not job.get("stdout_path") and not job.get("stderr_path"):
+        raise HTTPException(status_code=404, detail="No logs for this job")
+    return {
+        "job_id": job_id,
+        "stdout": _tail(job.get("stdout_path")),
+        "stderr": _tail(job.get("stderr_path")),
+    }
+
+
 @router.post("/e2e-tests/run")
 async def run_e2e_tests():
     """Run Playwright E2E tests and return JSON results.
@@ -161,7 +258,7 @@ async def run_e2e_tests():
     and Node/Playwright are available or run tests externally.
     """
     e2e_dir = _e2e_dir()
-    in_container = Path("/.dockerenv").exists()
+    in_container = _IN_CONTAINER
     if not e2e_dir.exists():
         detail = (
             "E2E tests directory not found. "
@@ -186,17 +283,21 @@ async def run_e2e_tests():
     # Ensure dependencies are installed if missing
     node_modules = e2e_dir / "node_modules"
     if not node_modules.exists():
-        await _run_command("npm ci || npm install", cwd=e2e_dir)
-        # Ensure Playwright browsers are installed
-        await _run_command("npx playwright install --with-deps || npx playwright install", cwd=e2e_dir)
+        await _install_dependencies(e2e_dir)
 
     # Run tests in CI mode (disables webServer hook from config)
     env = {
         "CI": "1",
         # Point tests to backend inside docker network if available; fallback to localhost
-        "API_BASE_URL": _os.getenv("API_BASE_URL", "http://backend:8000" if Path("/.dockerenv").exists() else "http://localhost:8000"),
+        "API_BASE_URL": _os.getenv("API_BASE_URL", "http://backend:8000" if _IN_CONTAINER else "http://localhost:8000"),
     }
-    run = await _run_command("npm test", cwd=e2e_dir, env=env)
+    run = await _run_command(
+        ["npm", "test"],
+        cwd=e2e_dir,
+        env=env,
+        stdout_path=results_dir / "last.stdout.log",
+        stderr_path=results_dir / "last.stderr.log",
+    )
 
     # Attempt to read results
     results_json = _read_results_json(results_json_path)
@@ -204,8 +305,8 @@ async def run_e2e_tests():
     return {
         "success": run["exit_code"] == 0,
         "exit_code": run["exit_code"],
-        "stdout": run["stdout"],
-        "stderr": run["stderr"],
+        "stdout": _tail(run["stdout_path"]),
+        "stderr": _tail(run["stderr_path"]),
         "results": results_json,
     }
 
@@ -0,0 +1,148 @@
+"""
+Todo API endpoints.
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+
+from app.api.deps import get_todo_service
+from app.api.v1.auth import get_current_user
+from app.db.models.todo import Todo
+from app.services.todo import TodoService
+
+router = APIRouter()
+
+
+def _encode_cursor(todo: Todo) -> str:
+    """Encode the keyset cursor for the last row of a page."""
+    return base64.urlsafe_b64encode(str(todo.id).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> int:
+    """Decode an opaque cursor back to the last-seen todo id."""
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (ValueError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+class TodoCreate(BaseModel):
+    title: str
+    description: Optional[str] = None
+    priority: str = "medium"
+
+
+class TodoUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    completed: Optional[bool] = None
+    priority: Optional[str] = None
+
+
+class TodoResponse(BaseModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    completed: bool
+    priority: str
+    owner_id: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TodoListResponse(BaseModel):
+    items: List[TodoResponse]
+    next_cursor: Optional[str] = None
+
+
+class TodoStatsResponse(BaseModel):
+    total: int
+    completed: int
+    pending: int
+    completion_rate: float
+
+
+@router.post("/todos", response_model=TodoResponse)
+async def create_todo(
+    todo_data: TodoCreate,
+    current_user = Depends(get_current_user),
+    todo_service: TodoService = Depends(get_todo_service)
+):
+    """Create a new todo."""
+    todo = await todo_service.create_todo(current_user.id, todo_data.model_dump())
+    return todo
+
+
+@router.get("/todos", response_model=TodoListResponse, response_class=ORJSONResponse)
+async def list_todos(
+    cursor: Optional[str] = None,
+    # Bounded so a crafted limit can't turn LIMIT into a full-table dump
+    limit: int = Query(100, ge=1, le=1000),
+    current_user = Depends(get_current_user),
+    todo_service: TodoService = Depends(get_todo_service)
+):
+    """List todos for the current user, newest first.
+
+    Pass the next_cursor from a previous page to fetch the following one.
+    """
+    keyset = _decode_cursor(cursor) if cursor else None
+    todos = await todo_service.get_todos(current_user.id, cursor=keyset, limit=limit)
+    next_cursor = _encode_cursor(todos[-1]) if todos and len(todos) == limit else None
+    return TodoListResponse(
+        items=[TodoResponse.model_validate(todo) for todo in todos],
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/todos/stats", response_model=TodoStatsResponse, response_class=ORJSONResponse)
+async def get_todo_stats(
+    current_user = Depends(get_current_user),
+    todo_service: TodoService = Depends(get_todo_service)
+):
+    """Get todo statistics for the current user."""
+    stats = await todo_service.get_todo_stats(current_user.id)
+    return stats
+
+
+@router.get("/todos/{todo_id}", response_model=TodoResponse)
+async def get_todo(
+    todo_id: int,
+    current_user = Depends(get_current_user),
+    todo_service: TodoService = Depends(get_todo_service)
+):
+    """Get a single todo."""
+    todo = await todo_service.get_user_todo(todo_id, current_user.id)
+    return todo
+
+
+@router.put("/todos/{todo_id}", response_model=TodoResponse)
+async def update_todo(
+    todo_id: int,
+    todo_data: TodoUpdate,
+    current_user = Depends(get_current_user),
+    todo_service: TodoService = Depends(get_todo_service)
+):
+    """Update a todo."""
+    todo = await todo_service.update_todo(todo_id, current_user.id, todo_data.model_dump(exclude_unset=True))
+    return todo
+
+
+@router.delete("/todos/{todo_id}")
+async def delete_todo(
+    todo_id: int,
+    current_user = Depends(get_current_user),
+    todo_service: TodoService = Depends(get_todo_service)
+):
+    """Delete a todo."""
+    success = await todo_service.delete_todo(todo_id, current_user.id)
+    return {"success": success}
@@ -29,6 +29,8 @@ class Settings(BaseSettings):
 
     # Feature flags
     AUTH_ENABLED: bool = True
+    TODOS_ENABLED: bool = True
+    ENABLE_METRICS: bool = True
 
     # CORS
     ALLOWED_ORIGINS: Union[str, List[str]] = ["http://localhost:3000", "http://localhost:8080"]
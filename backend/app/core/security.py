@@ -1,13 +1,19 @@
 """
 Security utilities for JWT tokens and password hashing.
-Simple hashlib-based implementation to avoid bcrypt compatibility issues.
+PBKDF2-based implementation (hashlib) to avoid bcrypt compatibility issues.
 """
+import asyncio
+import base64
 import hashlib
+import hmac
+import json
 import secrets
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Optional, Union
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import TTLCache
 from pydantic import BaseModel
 
 from app.core.config import settings
@@ -24,39 +30,91 @@ class TokenData(BaseModel):
     user_id: Optional[int] = None
 
 
+# Signing key and algorithm are constant for the process lifetime;
+# hoist them so encode/decode don't re-read settings per call
+_SIGNING_KEY = settings.JWT_SECRET_KEY
+_ALG = settings.JWT_ALGORITHM
+
+# Token lifetimes in seconds, precomputed so issuing a token is plain
+# integer arithmetic instead of datetime/timedelta allocations
+_ACCESS_TTL = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TTL = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+# Cache of verified tokens keyed by token digest. Verification is stable for
+# a token's lifetime, so a short TTL skips the HMAC + decode on repeat requests.
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+
+
+def _token_cache_key(token: str, token_type: str) -> bytes:
+    return hashlib.sha256(f"{token_type}:{token}".encode()).digest()
+
+
+def invalidate_token(token: str, token_type: str = "refresh") -> None:
+    """Evict a revoked token from the verification cache."""
+    _token_cache.pop(_token_cache_key(token, token_type), None)
+
+
+# PBKDF2 parameters; iterations are stored with the hash so they can be
+# raised later without invalidating existing rows
+_PBKDF2_ITERATIONS = 100_000
+
+
 def get_password_hash(password: str) -> str:
-    """Hash a password using SHA-256 with salt."""
+    """Hash a password using PBKDF2-HMAC-SHA256 with salt."""
     # Generate a random salt
     salt = secrets.token_hex(16)
-    # Hash password with salt
-    password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-    # Return salt + hash for storage
-    return f"{salt}:{password_hash}"
+    password_hash = hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), salt.encode(), _PBKDF2_ITERATIONS
+    ).hex()
+    # Return scheme + iterations + salt + hash for storage
+    return f"pbkdf2_sha256${_PBKDF2_ITERATIONS}${salt}${password_hash}"
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     try:
-        # Split salt and hash
-        salt, stored_hash = hashed_password.split(":", 1)
-        # Hash the provided password with the stored salt
-        password_hash = hashlib.sha256((plain_password + salt).encode()).hexdigest()
-        # Compare hashes
-        return password_hash == stored_hash
+        if hashed_password.startswith("pbkdf2_sha256$"):
+            _, iterations, salt, stored_hash = hashed_password.split("$", 3)
+            password_hash = hashlib.pbkdf2_hmac(
+                "sha256", plain_password.encode(), salt.encode(), int(iterations)
+            )
+        else:
+            # Legacy salt:hex format (single SHA-256 pass)
+            salt, stored_hash = hashed_password.split(":", 1)
+            password_hash = hashlib.sha256((plain_password + salt).encode()).digest()
+        # Constant-time compare on raw digests; == short-circuits on the
+        # first differing byte and leaks timing
+        return hmac.compare_digest(password_hash, bytes.fromhex(stored_hash))
     except ValueError:
         return False
 
 
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop.
+
+    pbkdf2_hmac releases the GIL, so the default executor is enough to
+    keep the loop responsive under login bursts.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
+        expire = int(time.time()) + _ACCESS_TTL
+
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=_ALG)
     return encoded_jwt
 
 
@@ -64,44 +122,93 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     """Create a JWT refresh token."""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+        expire = int(time.time()) + _REFRESH_TTL
+
+    to_encode.update({"exp": expire, "type": "refresh", "jti": secrets.token_hex(8)})
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=_ALG)
     return encoded_jwt
 
 
 def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
     """Verify and decode a JWT token."""
+    # Reject structurally invalid tokens before paying for hashing or HMAC;
+    # under fuzzing/credential stuffing most bad tokens fail this check
+    if token.count(".") != 2:
+        return None
+
+    cache_key = _token_cache_key(token, token_type)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=[_ALG])
+
         # Verify token type
         if payload.get("type") != token_type:
             return None
-        
+
         username: str = payload.get("sub")
         user_id: int = payload.get("user_id")
-        
+
         if username is None:
             return None
-        
+
         token_data = TokenData(username=username, user_id=user_id)
+
+        # Only cache tokens that outlive the cache TTL so an entry can never
+        # be served after the token itself has expired.
+        if payload.get("exp", 0) - time.time() > _token_cache.ttl:
+            _token_cache[cache_key] = token_data
         return token_data
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
+# Shared pieces for create_token_pair: both tokens use the same header, so
+# serialize it once and pre-hash it into a reusable HMAC state at import
+_SIGNING_KEY_BYTES = _SIGNING_KEY.encode()
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(
+    json.dumps({"alg": _ALG, "typ": "JWT"}, separators=(",", ":")).encode()
+).rstrip(b"=")
+_HMAC_HEADER_STATE = hmac.new(_SIGNING_KEY_BYTES, _JWT_HEADER_B64 + b".", "sha256")
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
 def create_token_pair(user_id: int, username: str) -> Token:
-    """Create access and refresh token pair."""
-    data = {"sub": username, "user_id": user_id}
-    
-    access_token = create_access_token(data)
-    refresh_token = create_refresh_token(data)
-    
-    return Token(
-        access_token=access_token,
-        refresh_token=refresh_token
-    )
\ No newline at end of file
+    """Create access and refresh token pair.
+
+    Builds both tokens directly rather than calling jwt.encode twice:
+    the header is serialized once at import and its HMAC state is shared
+    via .copy(), so each token only pays for its payload. Output is a
+    standard compact JWT that verify_token decodes as usual.
+    """
+    if _ALG != "HS256":
+        # Fast path only specializes HMAC-SHA256; fall back otherwise
+        data = {"sub": username, "user_id": user_id}
+        return Token(
+            access_token=create_access_token(data),
+            refresh_token=create_refresh_token(data),
+        )
+
+    now = int(time.time())
+    tokens = []
+    for token_type, ttl in (("access", _ACCESS_TTL), ("refresh", _REFRESH_TTL)):
+        payload = {"sub": username, "user_id": user_id, "exp": now + ttl, "type": token_type}
+        if token_type == "refresh":
+            # Refresh tokens land in a UNIQUE column; without a nonce two
+            # same-second logins mint byte-identical tokens and collide
+            payload["jti"] = secrets.token_hex(8)
+        payload_b64 = _b64url(json.dumps(payload, separators=(",", ":")).encode())
+        mac = _HMAC_HEADER_STATE.copy()
+        mac.update(payload_b64)
+        tokens.append(
+            (_JWT_HEADER_B64 + b"." + payload_b64 + b"." + _b64url(mac.digest())).decode()
+        )
+
+    return Token(access_token=tokens[0], refresh_token=tokens[1])
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Shared tracer with a zero-cost fallback when OpenTelemetry is absent.
+
+The per-module try/except blocks this replaces allocated a fresh span
+object (and its class) on every start_as_current_span call. Here the
+no-op path hands out one preallocated singleton, so tracing costs a
+single method call when OTel is not installed.
+"""
+import functools
+
+
+class _NoOpSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def set_attribute(self, key, value):
+        pass
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+class _NoOpTracer:
+    __slots__ = ()
+
+    def start_as_current_span(self, name):
+        return _NOOP_SPAN
+
+
+try:
+    from opentelemetry import trace
+
+    @functools.cache
+    def get_tracer(name: str):
+        """Return the memoized tracer for the given module name."""
+        return trace.get_tracer(name)
+except ImportError:
+    _NOOP_TRACER = _NoOpTracer()
+
+    def get_tracer(name: str):
+        """Return the shared no-op tracer; OpenTelemetry is not installed."""
+        return _NOOP_TRACER
@@ -1,9 +1,10 @@
 """
 Database configuration and session management.
 """
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 from app.core.config import settings
 
@@ -14,21 +15,53 @@ if settings.DATABASE_URL.startswith("sqlite"):
     # Only replace if it's not already aiosqlite
     if "aiosqlite" not in database_url:
         database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://")
-    
-    engine = create_async_engine(
-        database_url,
-        poolclass=StaticPool,
-        connect_args={"check_same_thread": False},
-        echo=settings.DEBUG
-    )
+
+    if ":memory:" in database_url:
+        # In-memory databases need the single shared connection of StaticPool
+        engine = create_async_engine(
+            database_url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+            echo=settings.DEBUG
+        )
+    else:
+        # File-backed SQLite can use a real pool so concurrent requests
+        # are not serialized on one connection
+        engine = create_async_engine(
+            database_url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            connect_args={"check_same_thread": False},
+            echo=settings.DEBUG
+        )
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets readers proceed during writes and NORMAL sync drops the
+        # per-commit fsync; both are no-ops for in-memory databases
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 else:
     # PostgreSQL configuration
     engine = create_async_engine(
         settings.DATABASE_URL,
         pool_size=settings.DB_POOL_SIZE,
         max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=1800,
+        pool_timeout=30,
         echo=settings.DEBUG,
-        pool_pre_ping=True
+        pool_pre_ping=True,
+        connect_args={
+            # The short OLTP queries here never amortize Postgres JIT
+            # compilation, and asyncpg's statement cache skips re-parse/
+            # re-plan for repeated statements on a connection
+            "server_settings": {"jit": "off"},
+            "statement_cache_size": 1024,
+        }
     )
 
 # Create session factory
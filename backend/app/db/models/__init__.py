@@ -2,5 +2,6 @@
 Database models module.
 """
 from .user import User, RefreshToken
+from .todo import Todo
 
-__all__ = ["User", "RefreshToken"]
\ No newline at end of file
+__all__ = ["User", "RefreshToken", "Todo"]
\ No newline at end of file
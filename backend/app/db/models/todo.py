@@ -0,0 +1,27 @@
+"""
+Todo model.
+"""
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class Todo(Base):
+    """Todo item owned by a user."""
+
+    __tablename__ = "todos"
+    __table_args__ = (
+        # get_by_user filters on owner_id and sorts by created_at desc;
+        # the composite index turns that into one index range scan
+        Index("ix_todos_owner_created", "owner_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String(200), index=True, nullable=False)
+    description = Column(Text, nullable=True)
+    completed = Column(Boolean, default=False, nullable=False)
+    priority = Column(String(20), default="medium", nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -2,5 +2,6 @@
 Repository pattern implementation.
 """
 from .user import UserRepository
+from .todo import TodoRepository
 
-__all__ = ["UserRepository"]
\ No newline at end of file
+__all__ = ["UserRepository", "TodoRepository"]
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+Todo repository with user-scoped query methods.
+"""
+from typing import List, Optional, Tuple
+from sqlalchemy import case, delete, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.tracing import get_tracer
+from app.db.models.todo import Todo
+from app.db.repositories.base import BaseRepository
+
+tracer = get_tracer(__name__)
+
+
+class TodoRepository(BaseRepository[Todo]):
+    """Todo repository."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(Todo, db)
+
+    async def get_by_user(
+        self,
+        user_id: int,
+        cursor: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Todo]:
+        """Get todos for a user, newest first, using keyset pagination.
+
+        The cursor is the id of the last row on the previous page; ids are
+        assigned in creation order (created_at is server-set), so this pages
+        the newest-first listing without OFFSET's scan-and-discard cost.
+        """
+        with tracer.start_as_current_span("db.query.get_by_user") as span:
+            span.set_attribute("db.operation", "select")
+            span.set_attribute("db.table", "todos")
+
+            stmt = select(Todo).where(Todo.owner_id == user_id)
+            if cursor is not None:
+                stmt = stmt.where(Todo.id < cursor)
+            stmt = stmt.order_by(Todo.created_at.desc(), Todo.id.desc()).limit(limit)
+            result = await self.db.execute(stmt)
+            return result.scalars().all()
+
+    async def get_user_todo(self, todo_id: int, user_id: int) -> Optional[Todo]:
+        """Get a single todo owned by a user."""
+        with tracer.start_as_current_span("db.query.get_user_todo") as span:
+            span.set_attribute("db.operation", "select")
+            span.set_attribute("db.table", "todos")
+
+            result = await self.db.execute(
+                select(Todo).where(Todo.id == todo_id, Todo.owner_id == user_id)
+            )
+            return result.scalar_one_or_none()
+
+    async def update_if_owner(
+        self, todo_id: int, user_id: int, data: dict
+    ) -> Optional[Todo]:
+        """Update a todo if owned by the user, returning the updated row.
+
+        The ownership check rides along in the UPDATE's WHERE clause, so
+        a mutation costs one roundtrip and can't race a separate SELECT.
+        """
+        with tracer.start_as_current_span("db.query.update_if_owner") as span:
+            span.set_attribute("db.operation", "update")
+            span.set_attribute("db.table", "todos")
+
+            result = await self.db.execute(
+                update(Todo)
+                .where(Todo.id == todo_id, Todo.owner_id == user_id)
+                .values(**data)
+                .returning(Todo)
+            )
+            return result.scalar_one_or_none()
+
+    async def delete_if_owner(self, todo_id: int, user_id: int) -> bool:
+        """Delete a todo if owned by the user; one roundtrip."""
+        with tracer.start_as_current_span("db.query.delete_if_owner") as span:
+            span.set_attribute("db.operation", "delete")
+            span.set_attribute("db.table", "todos")
+
+            result = await self.db.execute(
+                delete(Todo)
+                .where(Todo.id == todo_id, Todo.owner_id == user_id)
+                .returning(Todo.id)
+            )
+            return result.scalar_one_or_none() is not None
+
+    async def stats_by_user(self, user_id: int) -> Tuple[int, int]:
+        """Get (total, completed) counts for a user in one round trip.
+
+        sum(case(...)) works on both Postgres and SQLite; COUNT FILTER
+        would be Postgres-only.
+        """
+        with tracer.start_as_current_span("db.query.stats_by_user") as span:
+            span.set_attribute("db.operation", "select")
+            span.set_attribute("db.table", "todos")
+
+            result = await self.db.execute(
+                select(
+                    func.count(Todo.id),
+                    func.sum(case((Todo.completed == True, 1), else_=0))
+                ).where(Todo.owner_id == user_id)
+            )
+            total, completed = result.one()
+            return total, completed or 0
@@ -1,29 +1,46 @@
 """
 User repository with authentication-specific methods.
 """
-from typing import Optional
+from typing import Optional, Tuple
+from sqlalchemy import bindparam, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-try:
-    from opentelemetry import trace
-    tracer = trace.get_tracer(__name__)
-except ImportError:
-    # OpenTelemetry not available, use no-op tracer
-    class NoOpTracer:
-        def start_as_current_span(self, name):
-            class NoOpSpan:
-                def __enter__(self):
-                    return self
-                def __exit__(self, *args):
-                    pass
-                def set_attribute(self, key, value):
-                    pass
-            return NoOpSpan()
-    tracer = NoOpTracer()
 
+from app.core.tracing import get_tracer
 from app.db.models.user import User, RefreshToken
 from app.db.repositories.base import BaseRepository
 
+tracer = get_tracer(__name__)
+
+# Hot auth-path statements built once; executing with parameter dicts
+# reuses the cached compiled form instead of rebuilding the ClauseElement
+# tree on every call
+_STMT_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_STMT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_STMT_RT_BY_TOKEN = select(RefreshToken).where(
+    RefreshToken.token == bindparam("token"),
+    RefreshToken.is_revoked == False
+)
+_STMT_RT_WITH_USER = (
+    select(RefreshToken, User)
+    .join(User, RefreshToken.user_id == User.id)
+    .where(
+        RefreshToken.token == bindparam("token"),
+        RefreshToken.is_revoked == False
+    )
+)
+# "token" collides with the SET-clause namespace in an UPDATE, so the
+# where-clause parameter needs a distinct name
+_STMT_REVOKE_RT = (
+    update(RefreshToken)
+    .where(
+        RefreshToken.token == bindparam("b_token"),
+        RefreshToken.is_revoked == False
+    )
+    .values(is_revoked=True)
+    .returning(RefreshToken.id)
+)
+
 
 class UserRepository(BaseRepository[User]):
     """User repository."""
@@ -39,7 +56,7 @@ class UserRepository(BaseRepository[User]):
             span.set_attribute("db.username", username)
             
             result = await self.db.execute(
-                select(User).where(User.username == username)
+                _STMT_USER_BY_USERNAME, {"username": username}
             )
             return result.scalar_one_or_none()
     
@@ -50,7 +67,7 @@ class UserRepository(BaseRepository[User]):
             span.set_attribute("db.table", "users")
             
             result = await self.db.execute(
-                select(User).where(User.email == email)
+                _STMT_USER_BY_EMAIL, {"email": email}
             )
             return result.scalar_one_or_none()
     
@@ -73,21 +90,27 @@ class UserRepository(BaseRepository[User]):
             span.set_attribute("db.table", "refresh_tokens")
             
             result = await self.db.execute(
-                select(RefreshToken).where(
-                    RefreshToken.token == token,
-                    RefreshToken.is_revoked == False
-                )
+                _STMT_RT_BY_TOKEN, {"token": token}
             )
             return result.scalar_one_or_none()
     
+    async def get_refresh_token_with_user(
+        self, token: str
+    ) -> Optional[Tuple[RefreshToken, User]]:
+        """Get a live refresh token and its owner in one roundtrip."""
+        with tracer.start_as_current_span("db.query.get_refresh_token_with_user") as span:
+            span.set_attribute("db.operation", "select")
+            span.set_attribute("db.table", "refresh_tokens")
+
+            result = await self.db.execute(_STMT_RT_WITH_USER, {"token": token})
+            row = result.one_or_none()
+            return (row[0], row[1]) if row else None
+
     async def revoke_refresh_token(self, token: str) -> bool:
-        """Revoke a refresh token."""
+        """Revoke a refresh token with a single UPDATE."""
         with tracer.start_as_current_span("db.query.revoke_refresh_token") as span:
             span.set_attribute("db.operation", "update")
             span.set_attribute("db.table", "refresh_tokens")
-            
-            token_obj = await self.get_refresh_token(token)
-            if token_obj:
-                token_obj.is_revoked = True
-                return True
-            return False
\ No newline at end of file
+
+            result = await self.db.execute(_STMT_REVOKE_RT, {"b_token": token})
+            return result.scalar_one_or_none() is not None
\ No newline at end of file
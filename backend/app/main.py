@@ -1,38 +1,65 @@
 """
 FastAPI application entry point.
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from os import urandom
 import time
-import uuid
+
+from sqlalchemy import text
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
-from app.api.v1 import auth
+from app.api.v1 import auth, todos
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.db.base import Base, engine
 # Ensure models are imported so SQLAlchemy registers tables
 from app.db import models as _db_models  # noqa: F401
-from prometheus_fastapi_instrumentator import Instrumentator
+from prometheus_fastapi_instrumentator import Instrumentator, metrics
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
 
+async def _warm_pool():
+    """Open the pool's base connections ahead of the first request.
+
+    A cold asyncpg connect (TCP + TLS + auth) costs 50-150ms; paying it
+    here instead of inline keeps early p99 stable.
+    """
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(settings.DB_POOL_SIZE):
+                tg.create_task(_ping())
+        logger.info("Database pool warmed")
+    except* Exception as eg:
+        logger.warning(f"Pool warmup incomplete: {eg.exceptions!r}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
     logger.info("FastAPI application starting up")
-    # Ensure DB tables exist for auth flows
     try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables checked/created")
+        if settings.ENVIRONMENT in {"development", "test"}:
+            # Ensure DB tables exist for auth flows
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            logger.info("Database tables checked/created")
+        else:
+            # Alembic owns the schema elsewhere; warm the pool in the
+            # background so startup isn't blocked on it
+            asyncio.create_task(_warm_pool())
     except Exception as e:
         logger.error(f"Database init failed: {e}")
     yield
@@ -49,47 +76,99 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.ENVIRONMENT == "development" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT == "development" else None,
+    # orjson encodes responses in C; matters most for large list payloads
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Expose Prometheus /metrics endpoint and instrument requests
-Instrumentator().instrument(app).expose(app, include_in_schema=False)
+# Expose Prometheus /metrics endpoint and instrument requests.
+# Untemplated (404/typo) paths are ignored and health/metrics excluded so
+# label cardinality tracks route templates, not raw URLs; only the two
+# metric families we alert on are registered. ENABLE_METRICS=0 skips the
+# per-request observe() work entirely where nothing scrapes the endpoint.
+if settings.ENABLE_METRICS:
+    instrumentator = Instrumentator(
+        should_group_status_codes=True,
+        should_ignore_untemplated=True,
+        should_round_latency_decimals=True,
+        round_latency_decimals=3,
+        excluded_handlers=["/api/v1/health", "/metrics"],
+        inprogress_labels=False,
+    )
+    instrumentator.add(metrics.requests())
+    instrumentator.add(metrics.latency())
+    instrumentator.instrument(app).expose(app, include_in_schema=False)
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Enumerating what we actually use lets Starlette answer preflights
+    # with a set lookup, and max_age lets browsers cache the answer
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type", "x-request-id"],
+    max_age=86400,
 )
 
 
-@app.middleware("http")
-async def add_request_id_middleware(request: Request, call_next):
-    """Add request ID and timing to all requests."""
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
-    
-    start_time = time.time()
-    
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    response.headers["X-Request-ID"] = request_id
-    response.headers["X-Process-Time"] = str(process_time)
-    
-    logger.info(
-        "Request completed",
-        extra={
-            "request_id": request_id,
-            "method": request.method,
-            "path": request.url.path,
-            "status_code": response.status_code,
-            "duration": process_time
-        }
-    )
-    
-    return response
+class RequestIDMiddleware:
+    """Add a request ID and timing headers to all requests.
+
+    Implemented as pure ASGI rather than @app.middleware("http"):
+    BaseHTTPMiddleware spawns an extra task and builds Request/Response
+    wrappers per request, which measurably caps throughput.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Reuse a gateway-assigned id when present; otherwise 16 random
+        # bytes as hex (same entropy as uuid4 without the UUID object)
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                if 0 < len(value) <= 64:
+                    request_id = value.decode("latin-1")
+                break
+        if request_id is None:
+            request_id = urandom(16).hex()
+        scope.setdefault("state", {})["request_id"] = request_id
+        start_ns = time.perf_counter_ns()
+        status_code = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+                message["headers"].append((b"x-request-id", request_id.encode("latin-1")))
+                message["headers"].append(
+                    (b"x-process-time", f"{elapsed:.6f}".encode("ascii"))
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        # Skip building the extra dict entirely when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Request completed",
+                extra={
+                    "request_id": request_id,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "duration": (time.perf_counter_ns() - start_ns) / 1e9
+                }
+            )
+
+
+app.add_middleware(RequestIDMiddleware)
 
 
 @app.get("/api/v1/health")
@@ -98,6 +177,13 @@ async def health_check():
     return {"status": "ok", "service": "fastapi-backend"}
 
 
+if settings.DEBUG:
+    @app.get("/debug/pool", include_in_schema=False)
+    async def pool_status():
+        """Connection pool stats for sizing the pool under load."""
+        return {"pool": engine.pool.status()}
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler with logging."""
@@ -126,13 +212,31 @@ async def global_exception_handler(request: Request, exc: Exception):
 # Include routers
 from app.api.v1 import tests as tests_router
 
-# Only include auth endpoints when enabled
+# Only include feature endpoints when enabled
 if settings.AUTH_ENABLED:
     app.include_router(auth.router, prefix="/api/v1", tags=["auth"])
 
+# Todos depend on auth for the current-user dependency
+if settings.AUTH_ENABLED and settings.TODOS_ENABLED:
+    app.include_router(todos.router, prefix="/api/v1", tags=["todos"])
+
 # Hide test-control endpoints from OpenAPI schema
 app.include_router(tests_router.router, prefix="/api/v1", tags=["e2e-tests"], include_in_schema=False)
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        # uvloop + httptools ship with uvicorn[standard] and beat the
+        # stdlib loop/h11 parser by a wide margin on Linux
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        reload=settings.ENVIRONMENT == "development",
+        # the request-ID middleware already logs every request
+        access_log=False,
+        server_header=False,
+    )
\ No newline at end of file
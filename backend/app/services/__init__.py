@@ -2,5 +2,6 @@
 Business logic services.
 """
 from .auth import AuthService
+from .todo import TodoService
 
-__all__ = ["AuthService"]
\ No newline at end of file
+__all__ = ["AuthService", "TodoService"]
\ No newline at end of file
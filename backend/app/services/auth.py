@@ -2,35 +2,71 @@
 Authentication service with business logic.
 """
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import NamedTuple, Optional
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import get_tracer
 from app.core.security import (
     get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
     create_token_pair,
-    verify_token
+    verify_token,
+    invalidate_token
 )
 from app.db.repositories.user import UserRepository
 from app.db.models.user import User
 
-try:
-    from opentelemetry import trace
-    tracer = trace.get_tracer(__name__)
-except ImportError:
-    # OpenTelemetry not available, use no-op tracer
-    class NoOpTracer:
-        def start_as_current_span(self, name):
-            class NoOpSpan:
-                def __enter__(self):
-                    return self
-                def __exit__(self, *args):
-                    pass
-                def set_attribute(self, key, value):
-                    pass
-            return NoOpSpan()
-    tracer = NoOpTracer()
+tracer = get_tracer(__name__)
+
+# Verified against when the username doesn't exist, so unknown-user and
+# wrong-password probes cost the same and timing can't enumerate accounts
+_DUMMY_HASH = get_password_hash("not-a-real-password")
+
+
+class _UserRow(NamedTuple):
+    """Detached copy of the login-relevant user columns."""
+    id: int
+    username: str
+    hashed_password: str
+    is_active: bool
+
+
+# Login-path cache of user rows keyed by username. Rows change rarely
+# (password rotation, deactivation) and the short TTL bounds staleness;
+# plain tuples rather than ORM instances avoid detached-session issues.
+# Only active users are cached so misses and probes never are.
+_user_row_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
+# Rejections on hot paths (login loops, token probes) reuse preallocated
+# exceptions; the traceback is attached at raise time, so sharing is safe
+_EXC_BAD_CREDS = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Incorrect username or password",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_EXC_USERNAME_TAKEN = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Username already registered"
+)
+_EXC_EMAIL_TAKEN = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Email already registered"
+)
+_EXC_BAD_REFRESH = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid refresh token"
+)
+_EXC_REFRESH_EXPIRED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Refresh token expired or invalid"
+)
+_EXC_USER_INACTIVE = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="User not found or inactive"
+)
 
 
 class AuthService:
@@ -45,15 +81,27 @@ class AuthService:
         with tracer.start_as_current_span("service.auth.authenticate_user") as span:
             span.set_attribute("auth.username", username)
             
-            user = await self.user_repository.get_by_username(username)
+            user = _user_row_cache.get(username)
+            span.set_attribute("auth.cache_hit", user is not None)
+            if user is None:
+                user = await self.user_repository.get_by_username(username)
+                if user is not None and user.is_active:
+                    _user_row_cache[username] = _UserRow(
+                        user.id, user.username, user.hashed_password, user.is_active
+                    )
+
+            # Always burn a full hash verification, even for unknown users
+            hashed = user.hashed_password if user else _DUMMY_HASH
+            password_ok = await verify_password_async(password, hashed)
+
             if not user:
                 span.set_attribute("auth.result", "user_not_found")
                 return None
-            
-            if not verify_password(password, user.hashed_password):
+
+            if not password_ok:
                 span.set_attribute("auth.result", "invalid_password")
                 return None
-            
+
             if not user.is_active:
                 span.set_attribute("auth.result", "user_inactive")
                 return None
@@ -70,20 +118,14 @@ class AuthService:
             # Check if user already exists
             existing_user = await self.user_repository.get_by_username(username)
             if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already registered"
-                )
+                raise _EXC_USERNAME_TAKEN
             
             existing_email = await self.user_repository.get_by_email(email)
             if existing_email:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
+                raise _EXC_EMAIL_TAKEN
             
             # Create user
-            hashed_password = get_password_hash(password)
+            hashed_password = await get_password_hash_async(password)
             user_data = {
                 "username": username,
                 "email": email,
@@ -92,6 +134,7 @@ class AuthService:
             }
             
             user = await self.user_repository.create(user_data)
+            _user_row_cache.pop(username, None)
             span.set_attribute("auth.user_created", True)
             return user
     
@@ -100,11 +143,7 @@ class AuthService:
         with tracer.start_as_current_span("service.auth.login") as span:
             user = await self.authenticate_user(username, password)
             if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Incorrect username or password",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
+                raise _EXC_BAD_CREDS
             
             # Create token pair
             tokens = create_token_pair(user.id, user.username)
@@ -126,26 +165,16 @@ class AuthService:
             # Verify refresh token
             token_data = verify_token(refresh_token, "refresh")
             if not token_data:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid refresh token"
-                )
-            
-            # Check if token exists in database
-            stored_token = await self.user_repository.get_refresh_token(refresh_token)
-            if not stored_token or stored_token.expires_at < datetime.utcnow():
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Refresh token expired or invalid"
-                )
+                raise _EXC_BAD_REFRESH
             
-            # Get user
-            user = await self.user_repository.get(token_data.user_id)
-            if not user or not user.is_active:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User not found or inactive"
-                )
+            # Fetch the stored token and its owner in one roundtrip
+            row = await self.user_repository.get_refresh_token_with_user(refresh_token)
+            if not row or row[0].expires_at < datetime.utcnow():
+                raise _EXC_REFRESH_EXPIRED
+
+            user = row[1]
+            if not user.is_active:
+                raise _EXC_USER_INACTIVE
             
             # Create new token pair
             tokens = create_token_pair(user.id, user.username)
@@ -168,5 +197,6 @@ class AuthService:
         """Logout user by revoking refresh token."""
         with tracer.start_as_current_span("service.auth.logout") as span:
             success = await self.user_repository.revoke_refresh_token(refresh_token)
+            invalidate_token(refresh_token, "refresh")
             span.set_attribute("auth.logout_success", success)
             return success
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Todo service with business logic.
+"""
+from typing import List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.tracing import get_tracer
+from app.db.models.todo import Todo
+from app.db.repositories.todo import TodoRepository
+
+tracer = get_tracer(__name__)
+
+# Hoisted so validation costs one O(1) membership test, no per-request
+# list allocation or join to build the error string
+_VALID_PRIORITIES = frozenset(("low", "medium", "high"))
+_EXC_BAD_PRIORITY = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Priority must be one of: low, medium, high"
+)
+_EXC_TODO_NOT_FOUND = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="Todo not found"
+)
+# Explicitly-set nulls survive exclude_unset and would reach the UPDATE
+# as SET col=NULL, tripping the NOT NULL constraint as a 500; description
+# is the only column that may legitimately be cleared
+_NON_NULLABLE_FIELDS = ("title", "completed", "priority")
+_EXC_NULL_FIELD = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="title, completed and priority cannot be null"
+)
+
+
+class TodoService:
+    """Todo service."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.todo_repository = TodoRepository(db)
+
+    async def create_todo(self, user_id: int, todo_data: dict) -> Todo:
+        """Create a todo for a user."""
+        with tracer.start_as_current_span("service.todo.create_todo") as span:
+            span.set_attribute("todo.owner_id", user_id)
+
+            priority = todo_data.get("priority")
+            if priority is not None and priority not in _VALID_PRIORITIES:
+                raise _EXC_BAD_PRIORITY
+            todo = await self.todo_repository.create({**todo_data, "owner_id": user_id})
+            span.set_attribute("todo.created", True)
+            return todo
+
+    async def get_todos(
+        self,
+        user_id: int,
+        cursor: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Todo]:
+        """Get todos for a user."""
+        with tracer.start_as_current_span("service.todo.get_todos") as span:
+            span.set_attribute("todo.owner_id", user_id)
+            return await self.todo_repository.get_by_user(user_id, cursor=cursor, limit=limit)
+
+    async def get_user_todo(self, todo_id: int, user_id: int) -> Todo:
+        """Get a single todo, raising 404 if missing or not owned."""
+        with tracer.start_as_current_span("service.todo.get_user_todo") as span:
+            span.set_attribute("todo.id", todo_id)
+
+            todo = await self.todo_repository.get_user_todo(todo_id, user_id)
+            if not todo:
+                raise _EXC_TODO_NOT_FOUND
+            return todo
+
+    async def update_todo(self, todo_id: int, user_id: int, todo_data: dict) -> Todo:
+        """Update a todo owned by a user."""
+        with tracer.start_as_current_span("service.todo.update_todo") as span:
+            span.set_attribute("todo.id", todo_id)
+
+            for field in _NON_NULLABLE_FIELDS:
+                if field in todo_data and todo_data[field] is None:
+                    raise _EXC_NULL_FIELD
+
+            priority = todo_data.get("priority")
+            if priority is not None and priority not in _VALID_PRIORITIES:
+                raise _EXC_BAD_PRIORITY
+
+            if not todo_data:
+                # Nothing to change; UPDATE needs at least one value
+                return await self.get_user_todo(todo_id, user_id)
+
+            updated = await self.todo_repository.update_if_owner(todo_id, user_id, todo_data)
+            if updated is None:
+                raise _EXC_TODO_NOT_FOUND
+            span.set_attribute("todo.updated", True)
+            return updated
+
+    async def delete_todo(self, todo_id: int, user_id: int) -> bool:
+        """Delete a todo owned by a user."""
+        with tracer.start_as_current_span("service.todo.delete_todo") as span:
+            span.set_attribute("todo.id", todo_id)
+
+            deleted = await self.todo_repository.delete_if_owner(todo_id, user_id)
+            if not deleted:
+                raise _EXC_TODO_NOT_FOUND
+            span.set_attribute("todo.deleted", deleted)
+            return deleted
+
+    async def get_todo_stats(self, user_id: int) -> dict:
+        """Get todo counts and completion rate for a user."""
+        with tracer.start_as_current_span("service.todo.get_todo_stats") as span:
+            span.set_attribute("todo.owner_id", user_id)
+
+            total, completed = await self.todo_repository.stats_by_user(user_id)
+            pending = total - completed
+            completion_rate = completed / total if total else 0.0
+            return {
+                "total": total,
+                "completed": completed,
+                "pending": pending,
+                "completion_rate": completion_rate,
+            }
@@ -2,17 +2,41 @@
 Test configuration and fixtures.
 """
 import asyncio
+import os
+import orjson
 import pytest
 import pytest_asyncio
 from typing import AsyncGenerator, Generator
 import httpx
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from testcontainers.postgres import PostgresContainer
+from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.db.base import Base, get_database_session
 from app.core.config import settings
 
+# Per-statement SQL logging roughly doubles suite wall-clock time;
+# opt back in with SQL_ECHO=1 when debugging a query
+SQL_ECHO = os.getenv("SQL_ECHO") == "1"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing() -> Generator:
+    """Drop PBKDF2 to a single iteration for the whole test session.
+
+    Tests assert auth behavior, not hash strength, and the 100k-iteration
+    work factor dominates register/login wall-clock time. The iteration
+    count is stored with each hash, so verification always matches
+    whatever the hash was minted with — production hashes are untouched.
+    """
+    from app.core import security
+
+    mp = pytest.MonkeyPatch()
+    mp.setattr(security, "_PBKDF2_ITERATIONS", 1)
+    yield
+    mp.undo()
+
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
@@ -22,120 +46,221 @@ def event_loop() -> Generator:
     loop.close()
 
 
-@pytest.fixture(scope="session")
-async def postgres_container():
-    """Start PostgreSQL container for testing."""
-    with PostgresContainer("postgres:15") as postgres:
-        postgres.with_env("POSTGRES_DB", "test_db")
-        postgres.with_env("POSTGRES_USER", "test_user")
-        postgres.with_env("POSTGRES_PASSWORD", "test_password")
-        yield postgres
-
-
 @pytest_asyncio.fixture(scope="session")
-async def test_engine(postgres_container):
-    """Create test database engine."""
-    database_url = postgres_container.get_connection_url().replace(
-        "postgresql://", "postgresql+asyncpg://"
+async def test_engine():
+    """Create the in-memory SQLite test engine.
+
+    StaticPool pins one shared connection so the in-memory database (and
+    the schema built once here) survives the whole session — no disk,
+    no fsync, no container. Per-test isolation comes from
+    test_db_session's rolled-back savepoint, never from DDL.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=SQL_ECHO
     )
-    
-    engine = create_async_engine(database_url, echo=True)
-    
-    # Create tables
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_test_pragmas(dbapi_connection, connection_record):
+        # Disable the driver's implicit-commit handling so SAVEPOINTs and
+        # the outer rollback actually work (documented pysqlite quirk)
+        dbapi_connection.isolation_level = None
+        # Durability doesn't matter for a throwaway test database
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
+
     yield engine
-    
-    # Cleanup
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+
     await engine.dispose()
 
 
-@pytest_asyncio.fixture
-async def test_db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session."""
-    TestSessionLocal = async_sessionmaker(
-        test_engine,
+def _session_factory(conn) -> async_sessionmaker:
+    """Sessionmaker bound to an already-transactional connection."""
+    return async_sessionmaker(
+        bind=conn,
         class_=AsyncSession,
-        expire_on_commit=False
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
     )
-    
-    async with TestSessionLocal() as session:
-        yield session
-        await session.rollback()
+
+
+@pytest_asyncio.fixture(scope="class")
+async def class_db_connection(test_engine):
+    """Class-scoped connection wrapping each test class in one transaction.
+
+    Class-scoped rows (the shared test user) are written directly on this
+    transaction and survive the whole class; per-test writes happen above
+    a savepoint and are rolled back by test_db_session. The outer rollback
+    here discards everything when the class finishes.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        yield conn
+        await trans.rollback()
 
 
 @pytest_asyncio.fixture
-async def client(test_db_session) -> AsyncGenerator[httpx.AsyncClient, None]:
-    """Create test client with database session override."""
-    
-    def override_get_db():
+async def test_db_session(class_db_connection) -> AsyncGenerator[AsyncSession, None]:
+    """Create test database session isolated by a per-test savepoint.
+
+    Commits inside service code land on savepoints above this one;
+    rolling it back at teardown undoes the test's writes without
+    touching class-scoped fixture rows underneath.
+    """
+    nested = await class_db_connection.begin_nested()
+    async with _session_factory(class_db_connection)() as session:
+        yield session
+    if nested.is_active:
+        await nested.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create one shared test client for the whole session.
+
+    Building the client (and its ASGI transport) per test adds fixed
+    setup cost to every test for no isolation benefit — requests are
+    isolated by the per-test database override, not the client.
+
+    ASGITransport never dispatches lifespan events, so the app's
+    startup/shutdown (table creation, pool warmup) runs zero times, not
+    once per test — test_engine owns the schema instead.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    ) as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def post_json():
+    """POST helper that encodes request bodies with orjson.
+
+    httpx's json= argument goes through the stdlib encoder; the app
+    already responds via ORJSONResponse, so this keeps both directions
+    of every test request on the C encoder.
+    """
+
+    def _post(client, url, obj, headers=None):
+        merged = {"content-type": "application/json"}
+        if headers:
+            merged.update(headers)
+        return client.post(url, content=orjson.dumps(obj), headers=merged)
+
+    return _post
+
+
+@pytest.fixture(scope="session")
+def sync_client() -> Generator:
+    """Synchronous client for single-request, no-DB assertions.
+
+    TestClient skips the AnyIO dispatch hop of the async client; only
+    use it for tests whose requests never touch the database, since it
+    drives the app from its own event loop.
+    """
+    from fastapi.testclient import TestClient
+
+    yield TestClient(app)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _override_db(test_db_session):
+    """Point the app at the per-test database session."""
+
+    async def override_get_db():
         return test_db_session
-    
+
     app.dependency_overrides[get_database_session] = override_get_db
-    
-    async with httpx.AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
-    
+    yield
     app.dependency_overrides.clear()
 
 
-@pytest_asyncio.fixture
-async def test_user(test_db_session):
-    """Create test user."""
+@pytest_asyncio.fixture(scope="class")
+async def test_user(class_db_connection):
+    """Create the shared test user once per class.
+
+    Password hashing dominates user creation, so paying it per test is
+    the single biggest cost in auth-heavy runs. The row lives below the
+    per-test savepoint, so individual tests still roll back cleanly.
+    Tests that need to mutate the user should create their own.
+    """
     from app.services.auth import AuthService
-    
-    auth_service = AuthService(test_db_session)
-    user = await auth_service.create_user(
-        username="testuser",
-        email="test@example.com",
-        password="testpassword"
-    )
-    await test_db_session.commit()
+
+    async with _session_factory(class_db_connection)() as session:
+        auth_service = AuthService(session)
+        user = await auth_service.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpassword"
+        )
+        # The service only flushes; land the row on the class transaction
+        await session.commit()
     return user
 
 
 @pytest_asyncio.fixture
-async def auth_headers(test_user, test_db_session):
-    """Create authentication headers for test user."""
-    from app.services.auth import AuthService
-    
-    auth_service = AuthService(test_db_session)
-    tokens = await auth_service.login("testuser", "testpassword")
-    
-    return {"Authorization": f"Bearer {tokens.access_token}"}
+async def todo_factory(test_db_session, test_user):
+    """Insert todo rows directly through the session.
 
+    Precondition rows don't need to be created over HTTP; a direct
+    insert skips the request dispatch, JSON encode/decode and Pydantic
+    validation the POST path pays per row.
+    """
+    from app.db.models.todo import Todo
 
-# SQLite fixtures for offline testing
-@pytest_asyncio.fixture
-async def sqlite_engine():
-    """Create SQLite engine for offline testing."""
-    from sqlalchemy.ext.asyncio import create_async_engine
-    
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        echo=True
-    )
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    yield engine
-    
-    await engine.dispose()
+    async def _create(**kwargs):
+        kwargs.setdefault("owner_id", test_user.id)
+        todo = Todo(**kwargs)
+        test_db_session.add(todo)
+        await test_db_session.commit()
+        await test_db_session.refresh(todo)
+        return todo
+
+    return _create
 
 
 @pytest_asyncio.fixture
-async def sqlite_session(sqlite_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create SQLite test session."""
-    TestSessionLocal = async_sessionmaker(
-        sqlite_engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
-    
-    async with TestSessionLocal() as session:
-        yield session
-        await session.rollback()
\ No newline at end of file
+async def created_todo(todo_factory):
+    """A freshly inserted todo for tests that just need one to exist."""
+    return await todo_factory(title="Test Todo")
+
+
+@pytest_asyncio.fixture(scope="class")
+async def tokens(class_db_connection, test_user):
+    """Login once per class and share the resulting token pair.
+
+    The pair comfortably outlives a test class, so re-verifying the
+    password and re-signing tokens per test buys nothing. Tests that
+    revoke the refresh token do so above the per-test savepoint, so it
+    is valid again for the next test.
+    """
+    from app.services.auth import AuthService
+
+    async with _session_factory(class_db_connection)() as session:
+        auth_service = AuthService(session)
+        token_pair = await auth_service.login("testuser", "testpassword")
+        # Persist the stored refresh token alongside the user row
+        await session.commit()
+
+    return token_pair
+
+
+@pytest.fixture(scope="class")
+def auth_headers(tokens):
+    """Authentication headers for the shared test user."""
+    return {"Authorization": f"Bearer {tokens.access_token}"}
@@ -0,0 +1,74 @@
+"""
+Table-driven error-path tests.
+
+Each case is "call endpoint with bad input, expect 4xx + detail
+substring"; one parametrized test keeps the fixture wiring to a single
+item instead of six near-identical test bodies.
+"""
+import pytest
+import httpx
+
+pytestmark = pytest.mark.asyncio
+
+# (method, url, payload, authenticated, expected_status, detail_substring)
+_ERROR_CASES = [
+    pytest.param(
+        "post", "/api/v1/register",
+        {"username": "testuser", "email": "different@example.com", "password": "password"},
+        False, 400, "Username already registered",
+        id="register-duplicate-username",
+    ),
+    pytest.param(
+        "post", "/api/v1/login",
+        {"username": "testuser", "password": "wrongpassword"},
+        False, 401, "Incorrect username or password",
+        id="login-invalid-credentials",
+    ),
+    pytest.param(
+        "get", "/api/v1/me", None,
+        "invalid", 401, "Could not validate credentials",
+        id="me-invalid-token",
+    ),
+    pytest.param(
+        "get", "/api/v1/todos/99999", None,
+        True, 404, "Todo not found",
+        id="get-nonexistent-todo",
+    ),
+    pytest.param(
+        "get", "/api/v1/todos", None,
+        False, 403, "Not authenticated",
+        id="todos-unauthenticated",
+    ),
+    pytest.param(
+        "post", "/api/v1/todos",
+        {"title": "Test Todo", "priority": "urgent"},
+        True, 400, "Priority must be one of",
+        id="create-todo-invalid-priority",
+    ),
+]
+
+
+class TestErrorResponses:
+    """Rejection paths across auth and todo endpoints."""
+
+    @pytest.mark.parametrize(
+        "method,url,payload,authenticated,expected_status,detail", _ERROR_CASES
+    )
+    async def test_error_responses(
+        self, client: httpx.AsyncClient, auth_headers, post_json,
+        method, url, payload, authenticated, expected_status, detail,
+    ):
+        if authenticated == "invalid":
+            headers = {"Authorization": "Bearer invalid_token"}
+        elif authenticated:
+            headers = auth_headers
+        else:
+            headers = {}
+
+        if method == "post":
+            response = await post_json(client, url, payload, headers=headers)
+        else:
+            response = await client.get(url, headers=headers)
+
+        assert response.status_code == expected_status
+        assert detail in response.json()["detail"]